@@ -1,6 +1,6 @@
 """
 Demo script demonstrating how to use RadarCubeReader to stream radar cubes
-via SPI, extract a range profile, and plot it live using matplotlib animation.
+via SPI, extract a range profile, and plot it live using matplotlib blitting.
 
 Make sure your FTDI device is connected and the IWRL6432BOOST is powered on
 and configured to output radar cube data via SPI. Adjust the spi_uri
@@ -10,7 +10,6 @@ and radar parameters as needed.
 import time
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import threading
 import sys
 
@@ -29,52 +28,83 @@ SPI_CS = 0
 SPI_FREQ = 30e6
 SPI_MODE = 0
 SPI_MAX_CHUNK_SIZE = 65280 # Must be divisible by 4
+SPI_LATENCY = 1 # FTDI latency timer in ms
 
 # physics constants for range calculation
 C = 3e8                     # speed of light (m/s)
 BANDWIDTH = 2700e6          # radar bandwidth in Hz
 RANGE_RESOLUTION = C / (2 * BANDWIDTH)  # range resolution (meters per bin)
 
-# create dict that holds the latest processed data and metadata from the SPI thread
-shared_data_state = {
-    "frame": None,
-    "timestamp": None,
-    "prev_timestamp": None,
-    "frame_count": 0
-}
-frame_lock = threading.Lock()
+# interval in ms at which the GUI checks for a new frame (cheap, the plot is only redrawn on new frames)
+PLOT_POLL_INTERVAL_MS = 10
+# interval in ms at which the frame rate metrics are updated (requires a full redraw of the figure)
+METRICS_UPDATE_INTERVAL_MS = 1000
+
+# single slot holding the latest (real, imag, magnitude, timestamp, prev_timestamp, frame_count) tuple
+# published by the SPI thread. storing/loading one tuple reference is atomic in CPython, so no lock is needed
+latest_frame_state = [None]
+
+# set by the SPI thread whenever it published a new frame, so the plot is only redrawn if there is something new
+new_frame_event = threading.Event()
+
+# two sets of preallocated range profile buffers: the SPI thread fills the set not published last,
+# so the plot never sees a half-written profile and no array is allocated per frame.
+# real, imaginary part and magnitude are stored as separate contiguous float32 arrays, which is
+# what the plot lines consume, instead of strided views on a complex64 array
+_real_bufs = (np.empty(N_RANGE_BINS, dtype=np.float32), np.empty(N_RANGE_BINS, dtype=np.float32))
+_imag_bufs = (np.empty(N_RANGE_BINS, dtype=np.float32), np.empty(N_RANGE_BINS, dtype=np.float32))
+_mag_bufs  = (np.empty(N_RANGE_BINS, dtype=np.float32), np.empty(N_RANGE_BINS, dtype=np.float32))
 
 # timestamp when the data streaming started (used for overall frame rate calculation)
+# all demo timestamps are monotonic time.perf_counter_ns() values in nanoseconds
 start_time = None
 
 def spi_read_thread(reader: RadarCubeReader):
     """
     Background thread that continuously reads radar cubes from the reader
     """
-    global shared_data_state
     global start_time
 
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
+
+    # per-thread bookkeeping, only published as part of the state tuple
+    prev_timestamp = None
+    frame_count = 0
+    buf_idx = 0
+
+    # positional index of the displayed range profile, computed from the first cube's dims
+    profile_idx = None
 
     try:
         # iterate over the radar cubes provided by the reader
         for cube in reader:
-            current_frame_timestamp = time.time()
+            current_frame_timestamp = time.perf_counter_ns()
 
             try:
                 # only display first range profile in radar cube for demo purposes
-                latest_frame_data = cube.data.isel(virt_antenna=0, doppler_chirp=0).values
+                if profile_idx is None:
+                    profile_idx = cube.indexer(virt_antenna=0, doppler_chirp=0)
+                range_profile = cube.values[profile_idx]
+
+                # split into real, imaginary part and magnitude here, NumPy releases the GIL
+                #   so this overlaps with rendering
+                latest_frame_real = _real_bufs[buf_idx]
+                latest_frame_imag = _imag_bufs[buf_idx]
+                latest_frame_mag  = _mag_bufs[buf_idx]
+                np.copyto(latest_frame_real, range_profile.real)
+                np.copyto(latest_frame_imag, range_profile.imag)
+                np.abs(range_profile, out=latest_frame_mag)
             except Exception as e:
                 print(f"Error slicing radar cube in thread: {e}")
                 continue
 
-            with frame_lock:
-                # update shared vars
-                shared_data_state["prev_timestamp"] = shared_data_state["timestamp"]
-                shared_data_state["timestamp"] = current_frame_timestamp
-
-                shared_data_state["frame"] = latest_frame_data
-                shared_data_state["frame_count"] += 1
+            # publish the new state as one immutable tuple
+            frame_count += 1
+            latest_frame_state[0] = (latest_frame_real, latest_frame_imag, latest_frame_mag,
+                                     current_frame_timestamp, prev_timestamp, frame_count)
+            new_frame_event.set()
+            prev_timestamp = current_frame_timestamp
+            buf_idx ^= 1
 
     except Exception as e:
         print(f"Error in SPI read thread: {e}")
@@ -86,14 +116,14 @@ def spi_read_thread(reader: RadarCubeReader):
 fig, (ax_fft, ax_time) = plt.subplots(2, 1, figsize=(10, 8))
 plt.tight_layout(rect=[0, 0, 1, 0.95], pad=3.0)
 
-# x-axis data for plotting
-x_axis_fft = np.arange(N_RANGE_BINS) * RANGE_RESOLUTION
-x_axis_time = np.arange(N_RANGE_BINS)
+# x-axis data for plotting (float32 to match the float32 y data)
+x_axis_fft = np.arange(N_RANGE_BINS, dtype=np.float32) * np.float32(RANGE_RESOLUTION)
+x_axis_time = np.arange(N_RANGE_BINS, dtype=np.float32)
 
-# initialize plot lines
-line_fft, = ax_fft.plot([], [], lw=2)
-line_real, = ax_time.plot([], [], lw=2, color='blue', label='Real')
-line_imag, = ax_time.plot([], [], lw=2, color='red', label='Imaginary')
+# initialize plot lines (animated artists are excluded from full redraws and drawn by blitting)
+line_fft, = ax_fft.plot([], [], lw=2, animated=True)
+line_real, = ax_time.plot([], [], lw=2, color='blue', label='Real', animated=True)
+line_imag, = ax_time.plot([], [], lw=2, color='red', label='Imaginary', animated=True)
 
 # set initial plot limits and labels
 ax_fft.set_xlim(0, x_axis_fft[-1])
@@ -109,65 +139,108 @@ ax_time.set_ylabel("Amplitude Value")
 ax_time.set_title("Range FFT Real & Imaginary Components")
 ax_time.legend(loc='upper right')
 
-# add text elements for displaying frame rate metrics
+# add text elements for displaying frame rate metrics. they are part of the static background and
+# only updated once per METRICS_UPDATE_INTERVAL_MS, so no text has to be rendered per frame
 frame_rate_text = ax_fft.text(0.02, 0.98, '', transform=ax_fft.transAxes, ha='left', va='top', fontsize=10, bbox=dict(boxstyle='round,pad=0.5', fc='wheat', alpha=0.5))
 time_between_frames_text = ax_fft.text(0.98, 0.98, '', transform=ax_fft.transAxes, ha='right', va='top', fontsize=10, bbox=dict(boxstyle='round,pad=0.5', fc='wheat', alpha=0.5))
 
+# artists redrawn by blitting on every new frame
+animated_artists = (line_fft, line_real, line_imag)
+
+# static part of the figure (axes, labels, legend, metrics), captured after every full redraw
+background = None
+
 
 def init_plot():
-    line_fft.set_data([], [])
-    line_real.set_data([], [])
-    line_imag.set_data([], [])
+    # x data never changes, so it is set once here and only y data is updated per frame
+    empty_y = np.full(N_RANGE_BINS, np.nan)
+    line_fft.set_data(x_axis_fft, empty_y)
+    line_real.set_data(x_axis_time, empty_y)
+    line_imag.set_data(x_axis_time, empty_y)
     frame_rate_text.set_text('')
     time_between_frames_text.set_text('')
-    return line_fft, line_real, line_imag, frame_rate_text, time_between_frames_text
 
 
-def update_plot(frame):
+def draw_animated_artists():
+    for artist in animated_artists:
+        fig.draw_artist(artist)
+
+
+def on_draw(event):
     """
-    Updates the plot with the latest frame data and metrics.
-    Called by the matplotlib animation framework.
+    Captures the static background after a full redraw (e.g. on start or resize)
+    and draws the animated artists on top of it.
     """
-    global shared_data_state
-    global start_time
+    global background
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+    draw_animated_artists()
+
+
+def on_timer():
+    """
+    Called periodically by the GUI timer. Redraws the animated artists by blitting,
+    but only if the SPI thread published a new frame since the last redraw.
+    The event is only checked, not waited on, since this runs on the GUI thread.
+    """
+    if background is None or not new_frame_event.is_set():
+        return
+    new_frame_event.clear()
 
-    # Copy the shared state safely under the lock
-    with frame_lock:
-        current_frame_data = shared_data_state["frame"]
-        frame_timestamp = shared_data_state["timestamp"]
-        prev_timestamp = shared_data_state["prev_timestamp"]
-        frame_count = shared_data_state["frame_count"]
+    update_plot()
 
-    updated_artists = [line_fft, line_real, line_imag, frame_rate_text, time_between_frames_text]
+    fig.canvas.restore_region(background)
+    draw_animated_artists()
+    fig.canvas.blit(fig.bbox)
 
-    if current_frame_data is not None:
-        # calculate magnitude
-        fft_magnitude = np.abs(current_frame_data)
-        line_fft.set_data(x_axis_fft, fft_magnitude)
 
-        # update real and imaginary plots
-        line_real.set_data(x_axis_time, current_frame_data.real)
-        line_imag.set_data(x_axis_time, current_frame_data.imag)
+def update_plot():
+    """
+    Updates the plot lines with the latest frame data.
+    """
+    # get the latest published state (nothing to draw before the first frame arrived)
+    state = latest_frame_state[0]
+    if state is None:
+        return
+    current_frame_real, current_frame_imag, current_frame_mag = state[:3]
 
-        # update metrics
-        current_plot_time = time.time()
+    # update magnitude plot (already calculated by the SPI thread)
+    line_fft.set_ydata(current_frame_mag)
 
-        # calculate framerate
-        elapsed_time = current_plot_time - start_time if start_time is not None else 0
-        if elapsed_time > 0 and frame_count > 0:
-            frame_rate = frame_count / elapsed_time
-            frame_rate_text.set_text(f'Avg frame rate: {frame_rate:.2f} Hz')
-        else:
-            frame_rate_text.set_text('')
+    # update real and imaginary plots
+    line_real.set_ydata(current_frame_real)
+    line_imag.set_ydata(current_frame_imag)
 
-        # calculate time between frames
-        if frame_timestamp is not None and prev_timestamp is not None:
-            time_between_frames_ms = (frame_timestamp - prev_timestamp) * 1000
-            time_between_frames_text.set_text(f'Time between Frames: {time_between_frames_ms:.1f} ms')
-        else:
-            time_between_frames_text.set_text('')
 
-    return updated_artists
+def update_metrics():
+    """
+    Updates the frame rate metrics texts and requests a full redraw of the figure,
+    which also refreshes the blitting background. Called by a slow GUI timer.
+    """
+    global start_time
+
+    state = latest_frame_state[0]
+    if state is None:
+        return
+    frame_timestamp, prev_timestamp, frame_count = state[3:]
+
+    current_plot_time = time.perf_counter_ns()
+
+    # calculate framerate
+    elapsed_time = (current_plot_time - start_time) / 1e9 if start_time is not None else 0
+    if elapsed_time > 0 and frame_count > 0:
+        frame_rate = frame_count / elapsed_time
+        frame_rate_text.set_text(f'Avg frame rate: {frame_rate:.2f} Hz')
+    else:
+        frame_rate_text.set_text('')
+
+    # calculate time between frames
+    if frame_timestamp is not None and prev_timestamp is not None:
+        time_between_frames_ms = (frame_timestamp - prev_timestamp) / 1e6
+        time_between_frames_text.set_text(f'Time between Frames: {time_between_frames_ms:.1f} ms')
+    else:
+        time_between_frames_text.set_text('')
+
+    fig.canvas.draw_idle()
 
 
 if __name__ == "__main__":
@@ -184,23 +257,24 @@ if __name__ == "__main__":
             spi_cs=SPI_CS,
             spi_freq=SPI_FREQ,
             spi_mode=SPI_MODE,
-            spi_max_chunk_size=SPI_MAX_CHUNK_SIZE
+            spi_max_chunk_size=SPI_MAX_CHUNK_SIZE,
+            spi_latency=SPI_LATENCY
         )
 
         # start the background thread to read data
         thread = threading.Thread(target=spi_read_thread, args=(reader,), daemon=True)
         thread.start()
 
-        # create the matplotlib animation
-        # blit=True: Optimizes rendering by only redrawing the parts of the plot that have changed
-        ani = animation.FuncAnimation(
-            fig,
-            update_plot,
-            init_func=init_plot,
-            interval=50,
-            blit=True,
-            cache_frame_data=False 
-        )
+        # set up event-driven blitting: full redraws refresh the background, the timer
+        #   only redraws the animated artists when a new frame has arrived
+        init_plot()
+        fig.canvas.mpl_connect('draw_event', on_draw)
+        timer = fig.canvas.new_timer(interval=PLOT_POLL_INTERVAL_MS)
+        timer.add_callback(on_timer)
+        timer.start()
+        metrics_timer = fig.canvas.new_timer(interval=METRICS_UPDATE_INTERVAL_MS)
+        metrics_timer.add_callback(update_metrics)
+        metrics_timer.start()
 
         plt.show()
 
@@ -9,8 +9,10 @@ setup(
     packages=find_packages(where='src', exclude=["examples", "images"]),
     install_requires=[
         "numpy",
-        "pyftdi",
-        "xarray"
+        "pyftdi"
     ],
+    extras_require={
+        "xarray": ["xarray"]
+    },
     python_requires=">=3.10",
 )
\ No newline at end of file
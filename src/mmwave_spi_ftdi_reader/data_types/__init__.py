@@ -1 +1 @@
-from .radar_cube import RadarCube1D
\ No newline at end of file
+from .radar_cube import RadarCube1D, RadarCube1DSplit, INT16_COMPLEX_DTYPE
\ No newline at end of file
@@ -4,54 +4,65 @@ It includes classes for 1D processed radar cubes (result of Range-FFT).
 """
 import time
 import numpy as np
-import xarray as xr
+
+# structured dtype holding the sensor's native samples (two int16 per complex value) without conversion,
+#   at half the size of complex64. Access the parts with values['re'] and values['im']
+INT16_COMPLEX_DTYPE = np.dtype([('re', '<i2'), ('im', '<i2')])
 
 class RadarCube:
     """
-    Base class for radar cube data, leveraging xarray for named-axis handling.
+    Base class for radar cube data, providing lightweight named-axis handling
+    on top of a NumPy array.
 
     This class is intended to be a non-instantiable parent class.
-    It provides the core functionality for wrapping a NumPy array
-    into an xarray.DataArray with specified dimensions and attributes.
+    It stores the raw NumPy array together with its dimension names and
+    attributes, without building any additional per-frame containers.
 
     Attributes:
-        data (xr.DataArray):
-            Complex-valued xarray.DataArray holding the radar cube data.
-            The dimensions and coordinates are defined by the subclass.
-            The raw NumPy data can be accessed via `cube.data.values`.
-            Global attributes, such as the timestamp, are stored in
-            `cube.data.attrs`.
+        values (np.ndarray):
+            Complex-valued (complex64, or INT16_COMPLEX_DTYPE) NumPy array holding the radar cube data.
+        dims (tuple[str, ...]):
+            Names of the dimensions of `values`, defined by the subclass.
+        attrs (dict):
+            Global attributes, such as the timestamp.
+        name (str):
+            Name of the radar cube.
 
     Usage:
         This class should not be instantiated directly. Use subclasses
         like RadarCube1D.
     """
+    __slots__ = ("values", "dims", "attrs", "name")
 
     def __init__(self,
                  data: np.ndarray,
                  dims: tuple[str, ...],
-                 xdarr_name: str,
+                 name: str,
                  timestamp: float = None,
                  ):
         """
-        Initializes the RadarCube with radar data, creating an xarray.DataArray.
+        Initializes the RadarCube with radar data.
         This constructor is intended for use by subclasses.
 
         Args:
             data (np.ndarray):
-                Complex-valued NumPy array holding the raw cube data.
+                Complex64 or INT16_COMPLEX_DTYPE NumPy array holding the raw cube data.
                 Expected shape must match the provided dims tuple.
+                Stored by reference without conversion or copy, so the cube reflects
+                later changes to the array. Convert other dtypes explicitly before,
+                e.g. with `data.astype(np.complex64)`.
             dims (tuple[str, ...]):
                 A tuple of strings specifying the names of the dimensions
-                for the xarray.DataArray.
-            xdarr_name (str):
-                Name of the xarray DataArray.
+                of the data.
+            name (str):
+                Name of the radar cube.
             timestamp (float, optional):
                 Epoch time in seconds when this frame was captured.
                 Defaults to the current time if None.
 
         Raises:
-            TypeError: If the base class is instantiated directly or if data is not a NumPy array.
+            TypeError: If the base class is instantiated directly, if data is not a NumPy array
+                       or if its dtype is neither complex64 nor INT16_COMPLEX_DTYPE.
             ValueError: If the input data dimensions do not match the expected number of dimensions.
         """
         # ensure that class is not instantiated directly
@@ -66,36 +77,131 @@ class RadarCube:
         if data.ndim != len(dims):
             raise ValueError(f"Input data must be {len(dims)}D with shape corresponding to {dims}, but got shape {data.shape}")
 
-        # create the xarray DataArray from the numpy data
-        self.data = xr.DataArray(
-            data,
-            dims = dims,
-            name = xdarr_name
-        )
+        # only accept the dtypes the reader produces: converting anything else here would either lose
+        #   precision (complex128) or silently copy the array, so the cube would no longer share it
+        if data.dtype != np.complex64 and data.dtype != INT16_COMPLEX_DTYPE:
+            raise TypeError(f"Input 'data' must be of dtype complex64 or INT16_COMPLEX_DTYPE, but got {data.dtype}. "
+                            "Convert it explicitly, e.g. with data.astype(np.complex64).")
+
+        # store the numpy data by reference together with its dimension names
+        self.values = data
+        self.dims   = tuple(dims)
+        self.name   = name
 
-        # add timestamp to xarray .attrs metadata dict
+        # add timestamp to .attrs metadata dict
         current_timestamp = timestamp if timestamp is not None else time.time() # Use explicit check for None
-        self.data.attrs['timestamp'] = current_timestamp
+        self.attrs = {'timestamp': current_timestamp}
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the underlying NumPy array."""
+        return self.values.shape
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """
+        Exposes the cube to NumPy, so it can be passed to `np.asarray()` or
+        any function taking an array (e.g. `np.fft.fft(cube, axis=...)`)
+        without unwrapping `values` first.
+
+        Args:
+            dtype (np.dtype, optional): Requested dtype, converted if it differs.
+            copy (bool, optional): True to always copy, False to never copy,
+                                   None to copy only if needed (NumPy 2 semantics).
+
+        Returns:
+            np.ndarray: `values` itself, unless a copy or conversion is requested.
+
+        Raises:
+            ValueError: If copy is False but a dtype conversion is requested.
+        """
+        values = self.values
+        if dtype is not None and values.dtype != dtype:
+            if copy is False:
+                raise ValueError(f"Unable to avoid a copy while converting the radar cube from {values.dtype} to {dtype}.")
+            return values.astype(dtype)
+        return values.copy() if copy else values
+
+    def indexer(self, **indexers) -> tuple:
+        """
+        Translates named indexers into a positional index tuple for `values`.
+
+        The result only depends on the cube's dims, so it can be computed once
+        and reused as `cube.values[idx]` for every following cube of the same
+        layout, skipping the name lookup per frame.
+
+        Args:
+            **indexers: Mapping of dimension name to an integer, slice or
+                        array index. Dimensions that are not given are
+                        selected entirely.
+
+        Returns:
+            tuple: Positional index, one entry per dimension.
+
+        Raises:
+            ValueError: If an indexer refers to an unknown dimension.
+        """
+        unknown_dims = set(indexers).difference(self.dims)
+        if unknown_dims:
+            raise ValueError(f"Dimensions {sorted(unknown_dims)} do not exist. Expected one or more of {self.dims}")
+
+        return tuple(indexers.get(dim, slice(None)) for dim in self.dims)
+
+    def isel(self, **indexers) -> np.ndarray:
+        """
+        Selects data by dimension name and integer index, similar to
+        `xarray.DataArray.isel`.
+
+        Args:
+            **indexers: Mapping of dimension name to an integer, slice or
+                        array index. Dimensions that are not given are
+                        selected entirely.
+
+        Returns:
+            np.ndarray: The selected data, indexed directly on `values`
+                        (a view for integer and slice indexers).
+
+        Raises:
+            ValueError: If an indexer refers to an unknown dimension.
+        """
+        return self.values[self.indexer(**indexers)]
+
+    def to_xarray(self):
+        """
+        Converts the radar cube into an xarray.DataArray for offline analysis.
+
+        xarray is an optional dependency (`pip install .[xarray]`) and is only
+        imported when this method is called.
+
+        Returns:
+            xr.DataArray: DataArray sharing the cube's data, with its dims,
+                          name and a copy of its attrs.
+
+        Raises:
+            ImportError: If xarray is not installed.
+        """
+        import xarray as xr
+
+        return xr.DataArray(self.values, dims=self.dims, name=self.name, attrs=dict(self.attrs))
 
 class RadarCube1D(RadarCube):
     """
     Represents a 1D radar cube (after Range-FFT processing),
     handling both interleaved and non-interleaved formats.
 
-    Inherits from RadarCube to use xarray for data management.
+    Inherits from RadarCube for named-axis data management.
 
-    Stores radar data as an xarray.DataArray with dimensions depending
+    Stores radar data as a NumPy array with dimensions depending
     on the 'interleaved' flag:
     - Interleaved: ('rangebin', 'virt_antenna', 'doppler_chirp')
     - Non-interleaved: ('chirp', 'rx_antenna', 'rangebin')
 
     Attributes:
-        data (xr.DataArray):
-            Complex-valued xarray.DataArray holding the 1D radar cube data.
-            Dimensions depend on the 'interleaved' flag.
-            The raw NumPy data can be accessed via `cube.data.values`.
-            Metadata attributes, including timestamp and interleaved status,
-            are stored in `cube.data.attrs`.
+        values (np.ndarray):
+            Complex-valued (complex64, or INT16_COMPLEX_DTYPE) NumPy array holding the 1D radar cube data.
+        dims (tuple[str, ...]):
+            Dimension names, depending on the 'interleaved' flag.
+        attrs (dict):
+            Metadata attributes, including timestamp and interleaved status.
         interleaved (bool):
              Indicates whether the data is stored in the interleaved format.
 
@@ -106,28 +212,31 @@ class RadarCube1D(RadarCube):
         cube = RadarCube1D(arr_interleaved, interleaved = True)
 
         # access radar cube data
-        print(cube.data)        # get xarray data
-        print(cube.data.values) # get data as numpy array
-        print(cube.data.dims)   # get cube's dimension labels
-        print(cube.data.attrs)  # get attributes (timestamp, interleaved status)
+        print(cube.values)      # get data as numpy array
+        print(cube.dims)        # get cube's dimension labels
+        print(cube.attrs)       # get attributes (timestamp, interleaved status)
 
 
         # slice by (doppler_/)chirp / (virt_/rx_)antenna / rangebin
         # Examples:
         # get all rangebins across all antennas but from first chirp only
-            chirp0      = cube.data.isel(doppler_chirp=0)
+            chirp0      = cube.isel(doppler_chirp=0)
         # get all rangebins across all chirps but from second virtual antenna only
-            ant1        = cube.data.isel(virt_antenna=1)
+            ant1        = cube.isel(virt_antenna=1)
         # get 17th rangebin across all chirps and antennas
-            rangebin16  = cube.data.isel(rangebin=16)
+            rangebin16  = cube.isel(rangebin=16)
         # get range profile from first chirp and first antenna
-            rangeprof0  = cube.data.isel(doppler_chirp=0, virt_antenna=0)
+            rangeprof0  = cube.isel(doppler_chirp=0, virt_antenna=0)
     """
+    __slots__ = ("interleaved",)
+
     # define standard dimensions
     _DIMS_INTERLEAVED       = ("rangebin", "virt_antenna", "doppler_chirp")
     _DIMS_NON_INTERLEAVED   = ("chirp", "rx_antenna", "rangebin")
-    # define xarray name of 1D radar cube
-    _RADAR_CUBE_1D_XR_NAME = "radar_cube_1d"
+    # dimensions indexed by the interleaved flag (False -> 0, True -> 1)
+    _DIMS_BY_FLAG           = (_DIMS_NON_INTERLEAVED, _DIMS_INTERLEAVED)
+    # define name of 1D radar cube
+    _RADAR_CUBE_1D_NAME = "radar_cube_1d"
 
     def __init__(self,
                  data: np.ndarray,
@@ -138,9 +247,9 @@ class RadarCube1D(RadarCube):
 
         Args:
             data (np.ndarray):
-                Complex-valued NumPy array holding the 1D radar cube data.
-                Shape must match the dimensions corresponding to the
-                'interleaved' flag.
+                Complex64 (or INT16_COMPLEX_DTYPE) NumPy array holding the 1D radar
+                cube data, stored by reference. Shape must match the dimensions
+                corresponding to the 'interleaved' flag.
             interleaved (bool):
                 If True, data is assumed to be interleaved with dimensions
                 ('rangebin', 'virt_antenna', 'doppler_chirp').
@@ -151,7 +260,8 @@ class RadarCube1D(RadarCube):
                 Defaults to the current time if None.
 
         Raises:
-            TypeError: If data is not a NumPy array (inherited from base class).
+            TypeError: If data is not a NumPy array or not of dtype complex64 or
+                       INT16_COMPLEX_DTYPE (inherited from base class).
             ValueError: If the input data dimensions do not match the expected
                         dimensions for the given 'interleaved' status
                         (check handled by base class dimension check).
@@ -159,13 +269,236 @@ class RadarCube1D(RadarCube):
         self.interleaved = interleaved
 
         # determine the correct dimensions based on the interleaved flag
-        if self.interleaved:
-            dims_to_use = self._DIMS_INTERLEAVED
-        else:
-            dims_to_use = self._DIMS_NON_INTERLEAVED
+        dims_to_use = self._DIMS_BY_FLAG[bool(interleaved)]
 
         # call the parent class constructor with the data and selected dimensions
-        super().__init__(data, dims_to_use, self._RADAR_CUBE_1D_XR_NAME, timestamp=timestamp)
+        super().__init__(data, dims_to_use, self._RADAR_CUBE_1D_NAME, timestamp=timestamp)
+
+        # add the interleaved status as an attribute to the metadata
+        self.attrs['interleaved'] = self.interleaved
+
+    @classmethod
+    def _unchecked(cls,
+                   data: np.ndarray,
+                   interleaved: bool,
+                   timestamp: float = None) -> "RadarCube1D":
+        """
+        Creates a RadarCube1D without validating the input data.
+
+        Intended for producers such as the RadarCubeReader, which fully control
+        the type and shape of the data and validate their configuration once
+        up front. User code should use the regular constructor.
+
+        Args:
+            data (np.ndarray):
+                Complex64 (or INT16_COMPLEX_DTYPE) NumPy array matching the
+                dimensions of the 'interleaved' flag. Stored by reference.
+            interleaved (bool):
+                Whether the data is in interleaved format.
+            timestamp (float, optional):
+                Epoch time in seconds when this frame was captured.
+                Defaults to the current time if None.
+
+        Returns:
+            RadarCube1D: The radar cube wrapping `data`.
+        """
+        cube = cls.__new__(cls)
+        cube.values      = data
+        cube.dims        = cls._DIMS_BY_FLAG[bool(interleaved)]
+        cube.name        = cls._RADAR_CUBE_1D_NAME
+        cube.interleaved = interleaved
+        cube.attrs       = {'timestamp': timestamp if timestamp is not None else time.time(),
+                            'interleaved': interleaved}
+        return cube
+
+class RadarCube1DSplit(RadarCube1D):
+    """
+    Represents a 1D radar cube (after Range-FFT processing) whose real and
+    imaginary parts are stored as two separate float32 arrays instead of one
+    interleaved complex64 array.
+
+    Downstream processing that works on whole vectors of real or imaginary
+    parts (split-complex FFTs, filters) can use `re` and `im` directly,
+    without deinterleaving the complex samples first.
+
+    Inherits dims, attrs and named indexing from RadarCube1D. Since all
+    dims are shared by `re` and `im`, a positional index from `indexer()`
+    applies to both.
+
+    Attributes:
+        re (np.ndarray):
+            Real part (float32) of the 1D radar cube data.
+        im (np.ndarray):
+            Imaginary part (float32) of the 1D radar cube data, same shape as `re`.
+        values (np.ndarray):
+            Complex64 copy combined from `re` and `im`. Computed on every
+            access, so prefer `re` and `im` in performance critical code.
+            Unlike on RadarCube1D, writing to it does not change the cube.
+        dims (tuple[str, ...]):
+            Dimension names, depending on the 'interleaved' flag.
+        attrs (dict):
+            Metadata attributes, including timestamp and interleaved status.
+        interleaved (bool):
+             Indicates whether the data is stored in the interleaved format.
 
-        # add the interleaved status as an attribute to the DataArray metadata
-        self.data.attrs['interleaved'] = self.interleaved
\ No newline at end of file
+    Usage:
+        cube = RadarCube1DSplit(arr_re, arr_im, interleaved = True)
+
+        # get range profile from first chirp and first antenna
+        idx = cube.indexer(doppler_chirp=0, virt_antenna=0)
+        rangeprof0_re, rangeprof0_im = cube.re[idx], cube.im[idx]
+    """
+    __slots__ = ("re", "im")
+
+    def __init__(self,
+                 re: np.ndarray,
+                 im: np.ndarray,
+                 interleaved: bool,
+                 timestamp: float = None):
+        """
+        Initializes the RadarCube1DSplit with the real and imaginary parts of radar data.
+
+        Args:
+            re (np.ndarray):
+                Float32 real part of the 1D radar cube data, stored by reference.
+                Shape must match the dimensions corresponding to the 'interleaved' flag.
+            im (np.ndarray):
+                Float32 imaginary part of the 1D radar cube data, same shape as `re`.
+                Stored by reference.
+            interleaved (bool):
+                If True, data is assumed to be interleaved with dimensions
+                ('rangebin', 'virt_antenna', 'doppler_chirp').
+                If False, data is assumed to be non-interleaved with dimensions
+                ('chirp', 'rx_antenna', 'rangebin').
+            timestamp (float, optional):
+                Epoch time in seconds when this frame was captured.
+                Defaults to the current time if None.
+
+        Raises:
+            TypeError: If re or im is not a NumPy array of dtype float32.
+            ValueError: If re and im differ in shape or do not match the expected
+                        dimensions for the given 'interleaved' status.
+        """
+        if not isinstance(re, np.ndarray) or not isinstance(im, np.ndarray):
+            raise TypeError("Inputs 're' and 'im' must be NumPy arrays.")
+
+        # like RadarCube, only accept the dtype the reader produces instead of silently copying
+        #   (and possibly downcasting) the input
+        if re.dtype != np.float32 or im.dtype != np.float32:
+            raise TypeError(f"Inputs 're' and 'im' must be of dtype float32, but got {re.dtype} and {im.dtype}. "
+                            "Convert them explicitly, e.g. with re.astype(np.float32).")
+
+        if re.shape != im.shape:
+            raise ValueError(f"Inputs 're' and 'im' must have the same shape, but got {re.shape} and {im.shape}")
+
+        dims_to_use = self._DIMS_BY_FLAG[bool(interleaved)]
+        if re.ndim != len(dims_to_use):
+            raise ValueError(f"Input data must be {len(dims_to_use)}D with shape corresponding to {dims_to_use}, but got shape {re.shape}")
+
+        # store the float32 parts by reference
+        self.re          = re
+        self.im          = im
+        self.dims        = dims_to_use
+        self.name        = self._RADAR_CUBE_1D_NAME
+        self.interleaved = interleaved
+
+        current_timestamp = timestamp if timestamp is not None else time.time()
+        self.attrs = {'timestamp': current_timestamp, 'interleaved': interleaved}
+
+    @classmethod
+    def _unchecked(cls,
+                   re: np.ndarray,
+                   im: np.ndarray,
+                   interleaved: bool,
+                   timestamp: float = None) -> "RadarCube1DSplit":
+        """
+        Creates a RadarCube1DSplit without validating the input data.
+
+        Intended for producers such as the RadarCubeReader, which fully control
+        the type and shape of the data. User code should use the regular constructor.
+
+        Args:
+            re (np.ndarray):
+                Float32 real part matching the dimensions of the 'interleaved' flag.
+                Stored by reference.
+            im (np.ndarray):
+                Float32 imaginary part, same shape as `re`. Stored by reference.
+            interleaved (bool):
+                Whether the data is in interleaved format.
+            timestamp (float, optional):
+                Epoch time in seconds when this frame was captured.
+                Defaults to the current time if None.
+
+        Returns:
+            RadarCube1DSplit: The radar cube wrapping `re` and `im`.
+        """
+        cube = cls.__new__(cls)
+        cube.re          = re
+        cube.im          = im
+        cube.dims        = cls._DIMS_BY_FLAG[bool(interleaved)]
+        cube.name        = cls._RADAR_CUBE_1D_NAME
+        cube.interleaved = interleaved
+        cube.attrs       = {'timestamp': timestamp if timestamp is not None else time.time(),
+                            'interleaved': interleaved}
+        return cube
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Complex64 array combined from `re` and `im`, computed on every access.
+        It is a copy: writes to it (e.g. `cube.values[...] = x`) do not change
+        the cube, modify `re` and `im` instead.
+        """
+        values = np.empty(self.re.shape, dtype=np.complex64)
+        values.real = self.re
+        values.imag = self.im
+        return values
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the underlying NumPy arrays."""
+        return self.re.shape
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """
+        Exposes the cube to NumPy as the complex64 array combined from `re`
+        and `im`, which always is a new array.
+
+        Args:
+            dtype (np.dtype, optional): Requested dtype, converted if it differs.
+            copy (bool, optional): True or None to return the combined array,
+                                   False is not supported (NumPy 2 semantics).
+
+        Returns:
+            np.ndarray: The combined complex64 array, converted to dtype if requested.
+
+        Raises:
+            ValueError: If copy is False, since the parts cannot be combined without a copy.
+        """
+        if copy is False:
+            raise ValueError("Unable to avoid a copy while combining the real and imaginary parts of the radar cube.")
+        values = self.values
+        if dtype is not None and values.dtype != dtype:
+            return values.astype(dtype)
+        return values
+
+    def isel(self, **indexers) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Selects data by dimension name and integer index, similar to
+        `xarray.DataArray.isel`, on the real and imaginary parts.
+
+        Args:
+            **indexers: Mapping of dimension name to an integer, slice or
+                        array index. Dimensions that are not given are
+                        selected entirely.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The selected real and imaginary parts,
+                        indexed directly on `re` and `im` (views for integer and
+                        slice indexers).
+
+        Raises:
+            ValueError: If an indexer refers to an unknown dimension.
+        """
+        idx = self.indexer(**indexers)
+        return self.re[idx], self.im[idx]
@@ -3,19 +3,24 @@ This module provides a class for reading and parsing radar cube data
 from TI mmWave radar sensors via SPI using an FTDI adapter.
 It acts as an iterator yielding RadarCube objects.
 """
-import sys
+import time
+import logging
+from typing import Iterator
 import numpy as np
 from pyftdi.usbtools import UsbToolsError
 
 from .spi_ftdi_frame_reader import SpiFtdiFrameReader
-from .data_types.radar_cube import RadarCube1D
+from .data_types.radar_cube import RadarCube1D, RadarCube1DSplit, INT16_COMPLEX_DTYPE
+
+logger = logging.getLogger(__name__)
 
 class RadarCubeReader:
     """
     Reads and parses radar cube data via SPI from TI mmWave radar sensors using an underlying
     SpiFtdiFrameReader. Acts as an iterator, yielding RadarCube objects frame by frame.
 
-    Handles synchronization and data parsing from raw bytes into structured RadarCube1D objects.
+    Handles synchronization and data parsing from raw bytes into structured RadarCube1D objects
+    (or RadarCube1DSplit objects with output_format="split").
 
     Usage:
         reader = RadarCubeReader(num_tx_antennas=2,
@@ -26,7 +31,7 @@ class RadarCubeReader:
 
         try:
             for cube in reader:
-                print(f"Read cube with shape: {cube.data.shape}")
+                print(f"Read cube with shape: {cube.shape}")
                 # Process the radar cube data
         except RuntimeError as e:
             print(f"An error occurred during reading: {e}")
@@ -34,6 +39,9 @@ class RadarCubeReader:
             reader.close() # Ensure cleanup even if errors occur
 
     """
+    # supported values of the output_format argument
+    _OUTPUT_FORMATS = ("complex64", "split", "int16_complex")
+
     def __init__(self,
                 num_tx_antennas: int,
                 num_rx_antennas: int,
@@ -43,7 +51,12 @@ class RadarCubeReader:
                 spi_cs: int = 0,
                 spi_freq: float = 30e6,
                 spi_mode: int = 0,
-                spi_max_chunk_size: int = 65280
+                spi_max_chunk_size: int = 65280,
+                spi_latency: int = 1,
+                spi_prefetch: bool = False,
+                spi_hw_busy_wait: bool = False,
+                reuse_output: bool = False,
+                output_format: str = "complex64"
                ):
         """
         Initializes the RadarCubeReader and the underlying SpiFtdiFrameReader.
@@ -61,6 +74,23 @@ class RadarCubeReader:
             spi_max_chunk_size: (int): SPI max chunk size the SPI USB chip supports in one transfer,
                                             minus required overhead (defaults to 65024).
                                             Must be divisable by 4.
+            spi_latency: (int)      : FTDI latency timer in ms (defaults to 1).
+            spi_prefetch: (bool)    : If True, the next frame is read from SPI by a background thread
+                                      while the current one is parsed and processed (defaults to False).
+            spi_hw_busy_wait: (bool): If True, the FTDI waits for SPI_BUSY in hardware instead of the host
+                                      polling it (defaults to False). Requires SPI_BUSY on ADBUS5, see
+                                      SpiFtdiFrameReader.
+            reuse_output: (bool)    : If True, parse into two preallocated radar cube arrays used in
+                                      alternation instead of allocating a new array per frame
+                                      (defaults to False). A returned cube then shares its memory
+                                      with the cube returned two frames later, so it is only valid
+                                      until the next frame after it has been read; copy it to keep it.
+            output_format: (str)    : "complex64" to yield RadarCube1D objects holding one complex64 array,
+                                      "split" to yield RadarCube1DSplit objects holding separate float32
+                                      arrays for the real and imaginary part, or "int16_complex" to yield
+                                      RadarCube1D objects holding the sensor's native int16 samples as an
+                                      INT16_COMPLEX_DTYPE array at half the size of complex64
+                                      (defaults to "complex64").
 
         Raises:
             ValueError: If input parameters are invalid or result in inconsistent dimensions
@@ -75,6 +105,8 @@ class RadarCubeReader:
             raise ValueError("num_chirps_per_frame must be divisible by num_tx_antennas.")
         if num_range_bins % 4 != 0:
              raise ValueError("num_range_bins must be divisible by 4.")
+        if output_format not in self._OUTPUT_FORMATS:
+            raise ValueError(f"output_format must be one of {self._OUTPUT_FORMATS}, got '{output_format}'.")
 
 
         # calculate derived parameters
@@ -83,7 +115,30 @@ class RadarCubeReader:
         self.num_doppler_chirps = num_chirps_per_frame // num_tx_antennas # Use // for integer division
         # radar cube element is stored as cmplx16ImRe_t which is equivalent to 4 Bytes (2 int16)
         self.radar_cube_n_bytes   = self.num_virt_antennas * self.num_range_bins * self.num_doppler_chirps * 4
-        print(f"Expected radar cube size is set to {self.radar_cube_n_bytes} Bytes")
+        logger.info("Expected radar cube size is set to %d Bytes", self.radar_cube_n_bytes)
+
+        # shapes and counts needed to parse every frame, fixed by the configuration
+        #   (number of int16 values, MMWAVE-L-SDK order shape and interleaved order shape)
+        self._expected_int16_count = self.radar_cube_n_bytes // 2
+        self._sdk_format_shape     = (self.num_doppler_chirps, self.num_virt_antennas, self.num_range_bins)
+        self._cube_shape           = (self.num_range_bins, self.num_virt_antennas, self.num_doppler_chirps)
+
+        # whether the real and imaginary parts are output as separate float32 arrays
+        self.output_format = output_format
+        self._split_output = output_format == "split"
+        # whether the sensor's native int16 samples are output without conversion
+        self._int16_output = output_format == "int16_complex"
+        # dtype of the output array(s) per output format
+        self._output_dtype = {"complex64": np.complex64,
+                              "split": np.float32,
+                              "int16_complex": INT16_COMPLEX_DTYPE}[output_format]
+
+        # optional pair of preallocated outputs in interleaved (rangebin, virt_antenna, doppler_chirp)
+        #   order, parsed into in alternation so the consumer can hold one frame while the next one is parsed
+        self._cube_bufs = None
+        self._cube_buf_idx = 0
+        if reuse_output:
+            self._cube_bufs = (self._alloc_output(), self._alloc_output())
 
         # open the SpiFtdiFrameReader
         self._spi_reader: SpiFtdiFrameReader = None
@@ -94,7 +149,12 @@ class RadarCubeReader:
                 cs = spi_cs,
                 freq = spi_freq,
                 mode = spi_mode,
-                max_chunk_size = spi_max_chunk_size
+                max_chunk_size = spi_max_chunk_size,
+                latency = spi_latency,
+                prefetch = spi_prefetch,
+                hw_busy_wait = spi_hw_busy_wait,
+                # the Byte reorder is folded into the int16 parsing in _parse_frame_data
+                byte_swap = False
             )
         except UsbToolsError as e:
             raise RuntimeError(f"No FTDI device with the supplied FTDI URI '{spi_uri}' found, make sure the device is connected.") from e
@@ -107,65 +167,198 @@ class RadarCubeReader:
                     pass
             raise RuntimeError(f"Failed to open SPI FTDI Frame Reader: {e}") from e
 
-    def _parse_frame(self, raw_frame_bytes: bytes) -> RadarCube1D:
+    def _alloc_output(self) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+        """
+        Allocates an uninitialized output for one parsed frame in interleaved
+        (rangebin, virt_antenna, doppler_chirp) order.
+
+        Returns:
+            np.ndarray | tuple[np.ndarray, np.ndarray]: An array of the output format's dtype, or a
+                (real, imag) tuple of float32 arrays if output_format is "split".
+        """
+        if self._split_output:
+            return np.empty(self._cube_shape, dtype=self._output_dtype), np.empty(self._cube_shape, dtype=self._output_dtype)
+        return np.empty(self._cube_shape, dtype=self._output_dtype)
+
+    def _wrap_output(self, radar_cube_data: np.ndarray | tuple[np.ndarray, np.ndarray]) -> RadarCube1D:
+        """
+        Wraps a parsed frame into the radar cube object matching the output format.
+        Shape and dtype are guaranteed by the parser, so validation is skipped.
+
+        Args:
+            radar_cube_data (np.ndarray | tuple[np.ndarray, np.ndarray]): The output of `_parse_frame_data`.
+
+        Returns:
+            RadarCube1D: A RadarCube1D, or a RadarCube1DSplit if output_format is "split".
+        """
+        if self._split_output:
+            return RadarCube1DSplit._unchecked(*radar_cube_data, interleaved=True)
+        return RadarCube1D._unchecked(radar_cube_data, interleaved=True)
+
+    def _parse_frame(self, raw_frame_bytes: bytes | bytearray | memoryview) -> RadarCube1D:
         """
         Parses the raw byte data into a RadarCube1D object.
 
         Args:
-            raw_frame_bytes (bytes): The raw data received from SPI.
+            raw_frame_bytes (bytes | bytearray | memoryview): The raw data received from SPI.
 
         Returns:
-            RadarCube1D: The parsed radar cube data.
+            RadarCube1D: The parsed radar cube data
+                         (a RadarCube1DSplit if output_format is "split").
 
         Raises:
             ValueError: If the received data length doesn't match expected length
                         or if parsing with numpy/reshaping fails.
         """
-        received_len = len(raw_frame_bytes)
+        return self._wrap_output(self._parse_frame_data(raw_frame_bytes))
+
+    def _parse_frame_data(self,
+                          raw_frame_bytes: bytes | bytearray | memoryview
+                          ) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+        """
+        Parses the raw byte data into a complex NumPy array (or separate real and
+        imaginary arrays) in interleaved (rangebin, virt_antenna, doppler_chirp) order.
+
+        Args:
+            raw_frame_bytes (bytes | bytearray | memoryview):
+                The raw data received from SPI, in SPI Byte order (each 4 Bytes arrive as
+                [Byte_D, Byte_C, Byte_B, Byte_A]). Any object supporting the buffer protocol
+                works; it is read in place without being copied into bytes first.
+
+        Returns:
+            np.ndarray | tuple[np.ndarray, np.ndarray]:
+                The parsed complex64 radar cube data, a (real, imag) tuple of float32 arrays
+                if output_format is "split", or an INT16_COMPLEX_DTYPE array if output_format
+                is "int16_complex". If the reader was created with reuse_output=True,
+                this is one of the two preallocated outputs.
+
+        Raises:
+            ValueError: If the received data length doesn't match expected length
+                        or if parsing with numpy/reshaping fails.
+        """
+        # size in Bytes, independent of the item format of a memoryview
+        received_len = memoryview(raw_frame_bytes).nbytes
         if received_len != self.radar_cube_n_bytes:
             raise ValueError(f"Data length mismatch during parsing: Expected {self.radar_cube_n_bytes} bytes, received {received_len} bytes.")
 
         try:
-            # cast into int16, since one radar cube value is of type cmplx16ImRe_t, which is made up of two int16
-            #   so two subsequent Bytes transferred are transformed into one int16 (little-endian assumed by default)
-            data_int16 = np.frombuffer(raw_frame_bytes, dtype=np.int16)
+            # cast into int16, since one radar cube value is of type cmplx16ImRe_t, which is made up of two int16.
+            #   Each 4 Byte value arrives as [Byte_D, Byte_C, Byte_B, Byte_A], while the little-endian int16 pair is
+            #   ([Byte_A, Byte_B], [Byte_C, Byte_D]). Reading the raw Bytes as big-endian int16 yields the same two
+            #   values in swapped order, so no separate Byte reorder pass over the frame is needed.
+            #   np.frombuffer creates a view on the SPI reader's frame buffer without copying it; the buffer is
+            #   reused for the next frame, which is fine since the conversion below creates a new array.
+            data_int16 = np.frombuffer(raw_frame_bytes, dtype='>i2')
 
             # the number of int16 values should be exactly twice the number of complex samples
-            expected_int16_count = self.num_doppler_chirps * self.num_virt_antennas * self.num_range_bins * 2
-            if len(data_int16) != expected_int16_count:
-                 raise ValueError(f"Integer conversion mismatch: Expected {expected_int16_count} int16 values, got {len(data_int16)}.")
+            if len(data_int16) != self._expected_int16_count:
+                 raise ValueError(f"Integer conversion mismatch: Expected {self._expected_int16_count} int16 values, got {len(data_int16)}.")
 
-            # reshape the array of int16 into pairs of real, imag components
-            num_complex_samples = self.num_doppler_chirps * self.num_virt_antennas * self.num_range_bins
-            data_int16_reshaped = data_int16.reshape((num_complex_samples, 2))
-
-            # convert the int16 into actual complex values (using float32 for intermediate precision)
-            data_float32 = data_int16_reshaped.astype(np.float32)
-            cmplx_data_flat = data_float32[:, 0] + 1j * data_float32[:, 1]
-
-            # reshape 1D cmplx_data_flat array into MMWAVE-L-SDK data format order:
+            # split the int16 values into the real and imaginary components with strided slices of the 1D view.
+            #   Since each big-endian pair holds the two values in swapped order, every second value starting
+            #   at index 1 is a real and every second value starting at index 0 an imaginary part.
+            #   Then reshape each of them into MMWAVE-L-SDK data format order:
             #   Cube[chirp][antenna][range] (num_doppler_chirps, num_virt_antennas, num_range_bins)
-            radar_cube_data_sdk_format = cmplx_data_flat.reshape((
-                self.num_doppler_chirps,
-                self.num_virt_antennas,
-                self.num_range_bins
-            ))
+            real_int16_sdk_format = data_int16[1::2].reshape(self._sdk_format_shape)
+            imag_int16_sdk_format = data_int16[0::2].reshape(self._sdk_format_shape)
 
             # the radar cube is already interleaved by Rangeproc DPU. Although it arrives in SDK dimension order,
-            # it is interleaved in (Range, Virtual Antenna, Doppler Chirp) order.
-            # To create an appropriate RadarCube1D object with interleaved=True, it needs to be transposed
-            # to match that logical order.
-            # SDK order (chirp, antenna, range) -> Interleaved order (range, antenna, chirp)
-            radar_cube_data_interleaved = np.transpose(radar_cube_data_sdk_format, axes=(2, 1, 0))
-
-            # create RadarCube1D object and return it
-            cube = RadarCube1D(radar_cube_data_interleaved, interleaved=True)
-            return cube
+            # it is interleaved in (Range, Virtual Antenna, Doppler Chirp) order, so element [r, a, c] of the
+            # interleaved cube is stored at flat index (c * num_virt_antennas + a) * num_range_bins + r.
+            # A plain reshape into interleaved order would therefore mix up the dimensions; instead, the int16
+            # components are viewed transposed (SDK order (chirp, antenna, range) -> interleaved order
+            # (range, antenna, chirp), no copy) and assigned to the real and imaginary views of a C-contiguous
+            # complex64 cube (or to two C-contiguous float32 arrays for the split output format, or to the fields
+            # of a C-contiguous int16 array for the int16_complex output format). This casts (float32 holds every
+            # int16 exactly) and reorders each component in a single pass, so consumers get contiguous arrays
+            # without a hidden copy of a transposed view.
+            real_int16_interleaved = real_int16_sdk_format.transpose((2, 1, 0))
+            imag_int16_interleaved = imag_int16_sdk_format.transpose((2, 1, 0))
+            if self._cube_bufs is None:
+                radar_cube_data_interleaved = self._alloc_output()
+            else:
+                radar_cube_data_interleaved = self._cube_bufs[self._cube_buf_idx]
+                self._cube_buf_idx ^= 1
+
+            if self._split_output:
+                out_real, out_imag = radar_cube_data_interleaved
+            elif self._int16_output:
+                out_real, out_imag = radar_cube_data_interleaved['re'], radar_cube_data_interleaved['im']
+            else:
+                out_real, out_imag = radar_cube_data_interleaved.real, radar_cube_data_interleaved.imag
+            np.copyto(out_real, real_int16_interleaved)
+            np.copyto(out_imag, imag_int16_interleaved)
+            return radar_cube_data_interleaved
 
         except Exception as e:
             # catch any numpy/reshaping errors during parsing
             raise ValueError(f"Failed to parse raw bytes into RadarCube: {e}") from e
 
+    def _read_frame_data(self) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+        """
+        Reads the next raw frame from the underlying SPI reader and parses it.
+
+        Returns:
+            np.ndarray | tuple[np.ndarray, np.ndarray]: The parsed radar cube data (see `_parse_frame_data`).
+
+        Raises:
+            StopIteration: When the underlying SpiFtdiFrameReader indicates there are no more frames.
+            RuntimeError: If an error occurs during the read or parsing process,
+                          or if the reader has been closed.
+        """
+        # checked on every frame, since the reader may be closed while an iterator (e.g. of iter_raw()) is alive
+        if self._spi_reader is None:
+            raise RuntimeError("Cannot read from a closed RadarCubeReader.")
+
+        try:
+            # get a memoryview on the next raw frame from the underlying reader
+            # (this call will block until the full frame (radar_cube_n_bytes) is read)
+            raw_frame_bytes = next(self._spi_reader)
+
+            # parse the raw bytes into a NumPy array
+            return self._parse_frame_data(raw_frame_bytes)
+        except StopIteration:
+            self.close()
+            raise
+        except ValueError as e:
+            self.close()
+            raise RuntimeError(f"Error parsing frame: {e}") from e
+        except Exception as e:
+            self.close()
+            raise RuntimeError(f"Unexpected error during radar cube iteration: {e}") from e
+
+    def iter_raw(self) -> Iterator[tuple[np.ndarray | tuple[np.ndarray, np.ndarray], float, bool]]:
+        """
+        Returns an iterator over the radar cubes that does not wrap them in RadarCube1D
+        objects, for consumers that do not need named dimensions.
+
+        The iterator yields tuples of the radar cube data in interleaved (rangebin, virt_antenna,
+        doppler_chirp) order (a (real, imag) tuple of float32 arrays if output_format is "split"),
+        the epoch time in seconds when it was parsed and the interleaved flag (always True).
+
+        Returns:
+            Iterator[tuple[np.ndarray | tuple[np.ndarray, np.ndarray], float, bool]]: The iterator
+                over the radar cubes. It raises RuntimeError if an error occurs during the read or
+                parsing process, or if the reader is closed while the iterator is still in use.
+
+        Raises:
+            RuntimeError: If the reader has been closed (raised by this call, not on the first
+                          iteration).
+        """
+        if self._spi_reader is None:
+            raise RuntimeError("RadarCubeReader is not initialized or has been closed.")
+
+        return self._iter_raw()
+
+    def _iter_raw(self) -> Iterator[tuple[np.ndarray | tuple[np.ndarray, np.ndarray], float, bool]]:
+        """Generator behind iter_raw(), reading until the underlying SpiFtdiFrameReader stops."""
+        while True:
+            try:
+                data = self._read_frame_data()
+            except StopIteration:
+                return
+            yield data, time.time(), True
+
     def __iter__(self):
         """
         Returns the iterator object itself for use in loops.
@@ -188,7 +381,8 @@ class RadarCubeReader:
         This call will block until a full frame's worth of data is available from SPI.
 
         Returns:
-            RadarCube1D: The next available radar cube.
+            RadarCube1D: The next available radar cube
+                         (a RadarCube1DSplit if output_format is "split").
 
         Raises:
             StopIteration: When the underlying SpiFtdiFrameReader indicates there are no more frames.
@@ -200,24 +394,10 @@ class RadarCubeReader:
         if self._spi_reader is None:
             raise RuntimeError("Cannot call __next__ on a closed RadarCubeReader.")
 
-        try:
-            # get the next raw frame from the underlying reader
-            # (this call will block until the full frame (radar_cube_n_bytes) is read)
-            raw_frame_bytes = next(self._spi_reader)
-
-            # parse the raw bytes into a RadarCube1D object
-            radar_cube = self._parse_frame(raw_frame_bytes)
-
-            return radar_cube
-        except StopIteration:
-            self.close()
-            raise
-        except ValueError as e:
-            self.close()
-            raise RuntimeError(f"Error parsing frame: {e}") from e
-        except Exception as e:
-            self.close()
-            raise RuntimeError(f"Unexpected error during radar cube iteration: {e}") from e
+        # read and parse the next frame, then wrap it into a RadarCube1D object
+        #   (shape and dtype are guaranteed by the parser, so validation is skipped)
+        radar_cube_data = self._read_frame_data()
+        return self._wrap_output(radar_cube_data)
 
 
     def close(self) -> None:
@@ -225,15 +405,15 @@ class RadarCubeReader:
         Closes the underlying SpiFtdiFrameReader and releases resources.
 
         Ensures resources are cleaned up even if closing the SPI reader fails.
-        Prints a message indicating the close attempt and any errors during the underlying close.
+        Logs the close attempt and any errors during the underlying close.
         """
         if self._spi_reader:
-            print("Closing RadarCubeReader...")
+            logger.info("Closing RadarCubeReader...")
             try:
                  self._spi_reader.close()
             except Exception as e:
-                 print(f"Error while closing underlying SpiFtdiFrameReader: {e}", file=sys.stderr)
+                 logger.error("Error while closing underlying SpiFtdiFrameReader: %s", e)
             finally:
                 self._spi_reader = None
         else:
-             print("RadarCubeReader already closed or was not initialized.")
\ No newline at end of file
+             logger.info("RadarCubeReader already closed or was not initialized.")
\ No newline at end of file
@@ -3,11 +3,20 @@ A module for reading SPI data frames from an IWRL6432BOOST board
 using an FTDI USB-to-SPI adapter (like the C232HM-DDHSL-0),
 synchronized via a GPIO pin.
 """
-import sys
+import time
+import logging
+import queue
+from collections import deque
+import struct
+import threading
+import numpy as np
+from pyftdi.ftdi import Ftdi
 from pyftdi.spi import SpiController
 from pyftdi.usbtools import UsbToolsError
 from pyftdi.gpio import GpioPort
 
+logger = logging.getLogger(__name__)
+
 
 # Use GPIO pin for synchronization with the MCU. SPI_BUSY pin is 1 and goes to 0 when
 #   data can be read.
@@ -18,6 +27,34 @@ from pyftdi.gpio import GpioPort
 SPI_BUSY_ADBUS_PIN_INDEX    = 4
 SPI_BUSY_PIN_MASK           = (1 << SPI_BUSY_ADBUS_PIN_INDEX)
 
+# The MPSSE wait commands (WAIT_ON_LOW / WAIT_ON_HIGH) can only watch GPIOL1, which is ADBUS5
+#   (pin index 5, the purple wire of the C232HM-DDHSL-0). To let the FTDI wait for SPI_BUSY in
+#   hardware, SPI_BUSY has to be connected to this pin instead of ADBUS4.
+SPI_BUSY_HW_WAIT_ADBUS_PIN_INDEX = 5
+SPI_BUSY_HW_WAIT_PIN_MASK        = (1 << SPI_BUSY_HW_WAIT_ADBUS_PIN_INDEX)
+# Number of empty USB reads (each bound by the latency timer) per attempt to collect the rest of a chunk
+#   while the MPSSE still waits for SPI_BUSY
+HW_WAIT_READ_ATTEMPTS            = 8
+
+# MPSSE command polling the SPI_BUSY pin: read the low byte of the GPIO pins (ADBUS0-7) and flush the
+#   result right away, as PyFtdi's GpioPort.read() does
+SPI_BUSY_POLL_COMMAND            = bytes((Ftdi.GET_BITS_LOW, Ftdi.SEND_IMMEDIATE))
+# Sleep in s between successive polls of SPI_BUSY while it stays high: starting at the minimum, doubled
+#   after every poll up to the maximum, so a long wait yields the CPU while a short one is barely delayed
+SPI_BUSY_POLL_BACKOFF_MIN_S      = 1e-5
+SPI_BUSY_POLL_BACKOFF_MAX_S      = 1e-4
+
+# Number of frame buffers handed out to the consumer at a time: every returned frame stays valid until
+#   the call after the next one, so the consumer can still use it while the next frame is read
+NUM_HELD_FRAMES             = 2
+# Number of frame buffers used when prefetching: the ones held by the consumer, one being filled
+#   by the prefetch thread and one already filled and queued.
+PREFETCH_NUM_BUFFERS        = NUM_HELD_FRAMES + 2
+# Interval in s at which a prefetch thread waiting for a free buffer checks whether the reader was closed
+PREFETCH_POLL_TIMEOUT_S     = 0.1
+# Time in s that close() waits for the prefetch thread to finish before terminating the FTDI controller
+PREFETCH_JOIN_TIMEOUT_S     = 1.0
+
 class SpiFtdiFrameReader:
     """
     A SPI data reader for reading data from a IWRL6432BOOST via C232HM-DDHSL-0 FTDI USB cable
@@ -31,7 +68,11 @@ class SpiFtdiFrameReader:
                 cs: int = 0,
                 freq: float = 30e6,
                 mode: int = 0,
-                max_chunk_size: int = 65280):
+                max_chunk_size: int = 65280,
+                latency: int = 1,
+                byte_swap: bool = True,
+                prefetch: bool = False,
+                hw_busy_wait: bool = False):
         """
         Args:
             frame_length (int)  : Number of bytes that each call to `__next__()` will return. Must match the frame length
@@ -42,10 +83,28 @@ class SpiFtdiFrameReader:
             mode: (int)         : SPI mode (defaults to 0)
             max_chunk_size: (int): SPI max chunk size the SPI USB chip supports in one transfer,
                                     minus required overhead (defaults to 65024).
-                                    Must be divisable by 4.
+                                    Must be divisable by 4 and must not exceed the 65280 Bytes PyFtdi
+                                    supports per SPI transfer. Must match the chunk size of the MCU, which
+                                    signals every chunk via SPI_BUSY, so it is never adjusted here.
+            latency: (int)      : FTDI latency timer in ms, 1 to 255 (defaults to 1). PyFtdi ignores the
+                                    `latency` query of the URI, so the timer is set explicitly; otherwise
+                                    every USB read that does not fill a packet stalls until it expires.
+            byte_swap: (bool)   : If True (default), reorder each group of 4 Bytes from the SPI Byte order
+                                    [Byte_D, Byte_C, Byte_B, Byte_A] to [Byte_A, Byte_B, Byte_C, Byte_D].
+                                    If False, frames are returned in SPI Byte order and the consumer has to
+                                    account for it (e.g. by reading big-endian values).
+            prefetch: (bool)    : If True, frames are read by a background thread into a small pool of
+                                    buffers, so the next frame is read from SPI while the consumer still
+                                    processes the current one (defaults to False). Returned frames stay
+                                    valid as long as without prefetching.
+            hw_busy_wait: (bool): If True, the FTDI's MPSSE waits for SPI_BUSY to go low and then clocks the
+                                    chunk without any host round trip, instead of the host polling the pin
+                                    before each chunk (defaults to False). Requires SPI_BUSY to be connected
+                                    to ADBUS5 (GPIOL1), since the MPSSE can only wait on that pin.
 
         Raises:
-            ValueError: If frame_length or max_chunk_size are not divisible by 4.
+            ValueError: If frame_length or max_chunk_size are not divisible by 4, max_chunk_size
+                        is too large or latency is out of range.
             UsbToolsError: If PyFtdi is unable to open the FTDI device with the supplied URI.
             RuntimeError: If FTDI GPIO cannot be initialized
         """
@@ -54,21 +113,69 @@ class SpiFtdiFrameReader:
              raise ValueError("frame_length must be divisible by 4 (datasize in Bytes of SPI transaction).")
         if max_chunk_size % 4 != 0:
             raise ValueError("max_chunk_size must be divisible by 4 (datasize in Bytes of SPI transaction).")
+        # fail early instead of on the first read of a chunk larger than PyFtdi can transfer
+        if not 0 < max_chunk_size <= SpiController.PAYLOAD_MAX_LENGTH:
+            raise ValueError(f"max_chunk_size must be between 4 and {SpiController.PAYLOAD_MAX_LENGTH} Bytes.")
+        if not Ftdi.LATENCY_MIN <= latency <= Ftdi.LATENCY_MAX:
+            raise ValueError(f"latency must be between {Ftdi.LATENCY_MIN} and {Ftdi.LATENCY_MAX} ms.")
 
         self.frame_length   = frame_length
         self.max_chunk_size = max_chunk_size
+        self.byte_swap      = byte_swap
+        self.hw_busy_wait   = hw_busy_wait
+        self.mode           = mode
         self._spi           = SpiController(turbo=True)
         self._gpio_port: GpioPort = None
         self._port          = None
+        # persistent frame buffers, filled in place by __next__() in alternation and handed out as memoryviews
+        self._frame_mvs     = tuple(memoryview(bytearray(frame_length)) for _ in range(NUM_HELD_FRAMES))
+        self._frame_idx     = 0
+        # (offset, size) of every chunk of a frame: full chunks of max_chunk_size, followed by the
+        #   remainder if frame_length exceeds a multiple of it. Both are fixed, so this is computed once here
+        self._chunk_schedule = tuple((offset, min(max_chunk_size, frame_length - offset))
+                                     for offset in range(0, frame_length, max_chunk_size))
+        # set by close() to stop waiting for SPI_BUSY and to stop the prefetch thread
+        self._closing       = False
+        self._prefetch_thread: threading.Thread = None
+        # writes a received chunk into the frame buffer, chosen once here instead of branching per chunk
+        self._ingest_chunk  = self._ingest_chunk_swapped if byte_swap else self._ingest_chunk_plain
 
         try:
-            # configure SPI controller and get the SPI port
-            self._spi.configure(uri)
+            # configure SPI controller (incl. latency timer) and get the SPI port. The latency timer only delays
+            #   USB packets the FTDI is not told to flush: PyFtdi ends every SPI read command with SEND_IMMEDIATE,
+            #   so the tail of a chunk is returned right away whatever the chunk size, and the SPI_BUSY poll is
+            #   a single GPIO read flushed the same way. PyFtdi resets the timer itself when the device is closed
+            self._spi.configure(uri, latency=latency)
             self._port = self._spi.get_port(cs=cs, freq=freq, mode=mode)
 
+            # let PyFtdi request a whole SPI chunk per USB bulk read instead of one USB packet (512 Bytes)
+            #   at a time, so a chunk is fetched in a few large transfers (PyFtdi caps this at 16 KiB on Linux)
+            read_chunksize = self._usb_read_chunksize(max_chunk_size)
+            if read_chunksize is not None:
+                self._spi.ftdi.read_data_set_chunksize(read_chunksize)
+
+            # chunks smaller than the FTDI's RX FIFO (1 KiB on the FT232H) pay the full per-transfer overhead
+            #   (SPI_BUSY poll, USB round trip) for only a fraction of a FIFO worth of data. The chunk size is
+            #   dictated by the MCU, so only point out the misconfiguration instead of changing it
+            _, rx_fifo_size = self._spi.ftdi.fifo_sizes
+            if max_chunk_size < rx_fifo_size < frame_length:
+                logger.warning("max_chunk_size of %d Bytes is smaller than the FTDI RX FIFO (%d Bytes), "
+                               "consider increasing the SPI chunk size on the MCU.", max_chunk_size, rx_fifo_size)
+
             # configure GPIO port of the FTDI device used for reading the SPI_BUSY pin (0x00 = input)
             self._gpio_port = self._spi.get_gpio()
-            self._gpio_port.set_direction(SPI_BUSY_PIN_MASK, 0x00)
+            self._gpio_port.set_direction(SPI_BUSY_HW_WAIT_PIN_MASK if hw_busy_wait else SPI_BUSY_PIN_MASK, 0x00)
+
+            # prebuild the MPSSE command for every distinct chunk size of the schedule (a full and the last,
+            #   partial chunk of a frame), keyed by size. None if they cannot be built for this configuration
+            read_cmds = {chunk_size: self._build_read_command(chunk_size) for _, chunk_size in self._chunk_schedule}
+            self._read_cmds = None if None in read_cmds.values() else read_cmds
+            if self._read_cmds is not None:
+                # PyFtdi sets the SPI frequency lazily on the first transfer through SpiPort, which is bypassed
+                self._spi.ftdi.set_frequency(self._port.frequency)
+
+            if prefetch:
+                self._start_prefetch()
 
         except UsbToolsError as e:
             e.args = (f"SpiFtdiFrameReader is unable to open the provided FTDI URI via PyFtdi'{uri}': {e}",)
@@ -81,45 +188,158 @@ class SpiFtdiFrameReader:
             raise RuntimeError(f"Failed to configure FTDI or GPIO: {e}") from e
 
 
+    def _usb_read_chunksize(self, chunk_size: int) -> int | None:
+        """
+        Computes the USB bulk read length for reading chunks of chunk_size Bytes.
+
+        PyFtdi passes the read chunk size to libusb as the bulk read length as is, which has to be a
+        multiple of the USB max packet size (512 Bytes on the FT232H), otherwise the read can fail with
+        LIBUSB_ERROR_OVERFLOW. Every packet also starts with 2 modem status Bytes, which are added to the
+        chunk size before rounding it down to whole packets (at least one).
+
+        Args:
+            chunk_size (int): Number of data Bytes of a chunk.
+
+        Returns:
+            int | None: The read length in Bytes, or None if the max packet size is not available from
+                        PyFtdi, in which case its default chunk size is kept.
+        """
+        # PyFtdi has no public accessor for the max packet size of the opened device
+        packet_size = getattr(self._spi.ftdi, '_max_packet_size', 0)
+        if packet_size <= 2:
+            return None
+
+        num_packets = -(-chunk_size // (packet_size - 2))
+        raw_size = chunk_size + 2 * num_packets
+        return max(packet_size, raw_size // packet_size * packet_size)
+
+    def _start_prefetch(self) -> None:
+        """
+        Allocates the frame buffer pool and starts the prefetch thread.
+        Buffers circulate between the queue of free buffers (filled by the thread) and the
+        queue of filled frames (consumed by `__next__()`).
+        """
+        self._free_frames   = queue.Queue()
+        self._filled_frames = queue.Queue()
+        self._held_frames   = deque()
+        for frame_mv in self._frame_mvs:
+            self._free_frames.put(frame_mv)
+        for _ in range(PREFETCH_NUM_BUFFERS - len(self._frame_mvs)):
+            self._free_frames.put(memoryview(bytearray(self.frame_length)))
+
+        self._prefetch_thread = threading.Thread(target=self._prefetch_loop,
+                                                 name="SpiFtdiFrameReader-prefetch",
+                                                 daemon=True)
+        self._prefetch_thread.start()
+
     def __iter__(self):
         """Return the iterator object itself."""
         return self
 
-    def __next__(self) -> bytes:
+    def __next__(self) -> memoryview:
+        """
+        Reads the next frame synchronized by the SPI_busy pin, which has to go low before every chunk:
+        - hw_busy_wait=False (default): the host polls the SPI_busy pin on ADBUS4 until it is low,
+          then reads the chunk.
+        - hw_busy_wait=True: the read command of every chunk starts with the MPSSE WAIT_ON_LOW command,
+          so the FTDI itself waits for the SPI_busy pin on ADBUS5 (GPIOL1) without any polling by the host.
+        If prefetching is enabled, returns the oldest frame read by the background thread instead.
+
+        Returns:
+            memoryview: The full frame data of length self.frame_length. The underlying buffers
+                        are reused in alternation, so its content stays valid while the next frame
+                        is read, but is overwritten by the call after the next one.
+
+        Raises:
+            StopIteration: If an error occurs during reading that prevents further iteration.
+        """
+        if self._prefetch_thread is not None:
+            return self._next_prefetched()
+
+        frame_data = self._frame_mvs[self._frame_idx]
+        self._frame_idx = (self._frame_idx + 1) % NUM_HELD_FRAMES
+        self._read_frame(frame_data)
+
+        # return a view on the full frame (no copy, the buffer is reused two calls later)
+        return frame_data
+
+    def read_into(self, out) -> int:
         """
-        Reads the next frame synchronized by the SPI_busy pin.
-        Waits for the SPI_busy pin (ADBUS4) to go low before reading a chunk.
+        Reads the next frame directly into a buffer owned by the caller, e.g. a NumPy array,
+        instead of into the reader's own frame buffers. If prefetching is enabled, the oldest
+        prefetched frame is copied into it instead.
+
+        Args:
+            out: Writable, C-contiguous object supporting the buffer protocol, of exactly
+                 self.frame_length Bytes.
 
         Returns:
-            bytes: The full frame data of length self.frame_length.
+            int: Number of Bytes written to out (always self.frame_length).
 
         Raises:
+            ValueError: If out is read-only or does not have a size of self.frame_length Bytes.
+            TypeError: If out does not support the buffer protocol or is not C-contiguous.
             StopIteration: If an error occurs during reading that prevents further iteration.
         """
-        # read the entire frame, splitting into chunks if the frame_length exceeds max_chunk_size
-        remaining_bytes = self.frame_length
-        frame_data = bytearray()
+        out_mv = memoryview(out).cast('B')
+        if out_mv.readonly:
+            raise ValueError("out must be a writable buffer.")
+        if out_mv.nbytes != self.frame_length:
+            raise ValueError(f"out must have a size of {self.frame_length} Bytes, but has {out_mv.nbytes} Bytes.")
+
+        if self._prefetch_thread is not None:
+            out_mv[:] = self._next_prefetched()
+        else:
+            self._read_frame(out_mv)
+        return self.frame_length
+
+    def _read_frame(self, frame_data: memoryview) -> None:
+        """
+        Reads one full frame into frame_data, chunk by chunk, each chunk after the SPI_busy pin went low.
+
+        Args:
+            frame_data (memoryview): Writable buffer of length self.frame_length.
+
+        Raises:
+            StopIteration: If an error occurs during reading that prevents further iteration.
+        """
+        # bind the attributes and methods used per chunk and per poll to locals once per frame
+        #   (_closing and _port are still checked on self, since close() may reset them meanwhile)
+        hw_busy_wait    = self.hw_busy_wait
+        poll_spi_busy   = self._poll_spi_busy
+        read_chunk      = self._read_chunk_hw_wait if hw_busy_wait else self._read_chunk
+        ingest_chunk    = self._ingest_chunk
 
         try:
-            while remaining_bytes > 0:
+            # read the entire frame into the buffer, chunk by chunk as scheduled in __init__
+            for offset, chunk_size in self._chunk_schedule:
                 # poll _gpio_port to check if it has gone low, indicating that a chunk of data can be read
-                while True:
-                    try:
-                        gpio_state = self._gpio_port.read()
-                        if (gpio_state & SPI_BUSY_PIN_MASK) == 0:
-                            # pin is low, data is ready to be read
-                            break
-                    except Exception as e:
-                        raise StopIteration(f"Error during busy wait for SPI_BUSY signal: {e}") from e
+                #   (not needed if the MPSSE waits for SPI_BUSY itself)
+                poll_backoff_s = 0.0
+                while not hw_busy_wait:
+                    # stop waiting if the reader is closed meanwhile (e.g. from another thread)
+                    if self._closing:
+                        raise StopIteration("SpiFtdiFrameReader was closed.")
+                    # send the prebuilt poll command directly instead of going through GpioPort.read(),
+                    #   which takes the controller lock and assembles the same command on every poll.
+                    #   Errors are turned into StopIteration by the handler around the whole frame
+                    gpio_state = poll_spi_busy()
+                    if (gpio_state & SPI_BUSY_PIN_MASK) == 0:
+                        # pin is low, data is ready to be read
+                        break
+
+                    # pin is still high: back off before the next poll (the first one is repeated right away)
+                    if poll_backoff_s:
+                        time.sleep(poll_backoff_s)
+                    poll_backoff_s = min(poll_backoff_s * 2 or SPI_BUSY_POLL_BACKOFF_MIN_S, SPI_BUSY_POLL_BACKOFF_MAX_S)
 
                 try:
                     # once the SPI_BUSY signal is low, read the expected chunk length
-                    chunk_size = min(remaining_bytes, self.max_chunk_size)
                     # ensure port is available
                     if self._port is None:
                         raise StopIteration("SPI port not initialized or was closed prematurely.")
 
-                    chunk = self._port.read(chunk_size)
+                    chunk = read_chunk(chunk_size)
 
                     if not chunk:
                         raise StopIteration(f"Error: No data received after SPI_BUSY signal changed to low, expected {chunk_size} bytes.")
@@ -131,32 +351,204 @@ class SpiFtdiFrameReader:
                 except Exception as e:
                     raise StopIteration(f"Error during SPI chunk read: {e}") from e
 
-                # each set of 4 Byte arrives in Byte order [Byte_D, Byte_C, Byte_B, Byte_A], so order needs to be switched
-                #   before adding it to frame_data.
-                #   (It is guaranteed that chunk_size is a multiple of 4 because max_chunk_size
-                #   and frame_length are validated in __init__.)
-                for i in range(0, chunk_size, 4):
-                    byte_D = chunk[i]
-                    byte_C = chunk[i + 1]
-                    byte_B = chunk[i + 2]
-                    byte_A = chunk[i + 3]
-
-                    frame_data.append(byte_A)
-                    frame_data.append(byte_B)
-                    frame_data.append(byte_C)
-                    frame_data.append(byte_D)
-
-                remaining_bytes -= chunk_size
+                ingest_chunk(frame_data[offset:offset + chunk_size], chunk)
         except Exception as e:
              raise StopIteration(f"An unexpected error occurred during frame reading: {e}") from e
 
-        # return the full frame as immutable bytes
-        return frame_data
+    @staticmethod
+    def _ingest_chunk_plain(dest: memoryview, chunk: bytes) -> None:
+        """
+        Copies a chunk into its slice of the frame buffer as received (SPI Byte order).
+
+        Args:
+            dest (memoryview): Slice of the frame buffer, of the same length as chunk.
+            chunk (bytes): The chunk as received over SPI.
+        """
+        dest[:] = chunk
+
+    @staticmethod
+    def _ingest_chunk_swapped(dest: memoryview, chunk: bytes) -> None:
+        """
+        Copies a chunk into its slice of the frame buffer, reordering each group of 4 Bytes.
+
+        Each set of 4 Byte arrives in Byte order [Byte_D, Byte_C, Byte_B, Byte_A], so order needs to be switched
+        to [Byte_A, Byte_B, Byte_C, Byte_D]. Reversing each group of 4 Bytes is a 32-bit byteswap: copying the
+        chunk as big-endian uint32 into a little-endian uint32 view of the frame buffer lets NumPy reorder and
+        store it in a single pass (no temporary array or bytes object).
+        (It is guaranteed that the chunk length is a multiple of 4 because max_chunk_size
+        and frame_length are validated in __init__.)
+
+        Args:
+            dest (memoryview): Slice of the frame buffer, of the same length as chunk.
+            chunk (bytes): The chunk as received over SPI.
+        """
+        np.copyto(np.frombuffer(dest, dtype='<u4'), np.frombuffer(chunk, dtype='>u4'))
+
+    def _build_read_command(self, size: int) -> bytes | None:
+        """
+        Builds the MPSSE command sequence that PyFtdi's SpiPort.read() sends to read size Bytes: select the
+        slave (chip select prolog), read, flush the result (SEND_IMMEDIATE) and deselect it again (epilog).
+
+        The sequence only depends on the SPI mode, chip select and GPIO configuration, which do not change
+        after __init__, so it is built once and sent as is for every chunk instead of being assembled per call.
+        If hw_busy_wait is enabled, the sequence starts with WAIT_ON_LOW, so waiting for SPI_BUSY and reading
+        the chunk are submitted in a single USB write.
+
+        Args:
+            size (int): Number of Bytes to read, 1 to 65280.
+
+        Returns:
+            bytes | None: The command sequence, or None if it cannot be built, which is the case for SPI modes
+                          with CPHA set (emulated by PyFtdi with 3-phase clocking) or if the PyFtdi internals
+                          differ. Chunks are then read via SpiPort.read().
+        """
+        port = self._port
+        spi = self._spi
+        # SPI mode bits are CPOL (0x2) and CPHA (0x1), taken from the configured mode since
+        #   SpiPort.mode does not report CPOL in the same encoding
+        if self.mode & 0x1:
+            return None
+
+        try:
+            direction = spi.direction & 0xFF
+            pins_low = spi._gpio_low
+
+            def set_bits_low(ctrl: int) -> tuple[int, int, int]:
+                return Ftdi.SET_BITS_LOW, (ctrl & spi._spi_mask) | pins_low, direction
+
+            cmd = bytearray((Ftdi.WAIT_ON_LOW,) if self.hw_busy_wait else ())
+            for ctrl in port._cs_prolog:
+                cmd.extend(set_bits_low(ctrl))
+            read_opcode = Ftdi.READ_BYTES_PVE_MSB if self.mode & 0x2 else Ftdi.READ_BYTES_NVE_MSB
+            # the MPSSE expects the length minus 1
+            cmd.extend(struct.pack('<BH', read_opcode, size - 1))
+            cmd.append(Ftdi.SEND_IMMEDIATE)
+            for ctrl in port._cs_epilog:
+                cmd.extend(set_bits_low(ctrl))
+            # restore idle state (all chip selects high)
+            cmd.extend((Ftdi.SET_BITS_LOW, spi._cs_bits | pins_low, direction))
+        except AttributeError:
+            return None
+
+        return bytes(cmd)
+
+    def _poll_spi_busy(self) -> int:
+        """
+        Reads the state of the GPIO pins ADBUS0-7 in a single USB round trip.
+
+        Returns:
+            int: The pin states, SPI_BUSY is low if (state & SPI_BUSY_PIN_MASK) == 0.
+
+        Raises:
+            RuntimeError: If the FTDI did not return the pin states.
+        """
+        ftdi = self._spi.ftdi
+        ftdi.write_data(SPI_BUSY_POLL_COMMAND)
+        # USB reads may happen before the FTDI sent the data, so allow a few empty reads (as PyFtdi does)
+        data = ftdi.read_data_bytes(1, 4)
+        if len(data) != 1:
+            raise RuntimeError("Unable to read the SPI_BUSY pin.")
+        return data[0]
+
+    def _read_chunk(self, chunk_size: int) -> bytes:
+        """
+        Reads one chunk over SPI, by sending the prebuilt MPSSE command if available.
+
+        Args:
+            chunk_size (int): Number of Bytes to read, one of the chunk sizes of the schedule.
+
+        Returns:
+            bytes: The chunk, shorter than chunk_size if the FTDI did not return all data in time.
+        """
+        read_cmds = self._read_cmds
+        if read_cmds is None:
+            return self._port.read(chunk_size)
+
+        ftdi = self._spi.ftdi
+        ftdi.write_data(read_cmds[chunk_size])
+        # USB reads may happen before the FTDI sent the data, so allow a few empty reads (as PyFtdi does)
+        return ftdi.read_data_bytes(chunk_size, 4)
+
+    def _read_chunk_hw_wait(self, chunk_size: int) -> bytes:
+        """
+        Reads one chunk, letting the MPSSE wait for SPI_BUSY (on ADBUS5) to go low before clocking it.
+
+        The MPSSE executes commands in order, so a WAIT_ON_LOW command queued in front of the SPI read
+        command holds the read back until the MCU is ready, without polling the pin from the host.
+        The prebuilt read commands already start with it; it is only sent separately for SpiPort.read().
+
+        Args:
+            chunk_size (int): Number of Bytes to read.
+
+        Returns:
+            bytes: The chunk, shorter than chunk_size only if the reader was closed while waiting.
+        """
+        ftdi = self._spi.ftdi
+        if self._read_cmds is None:
+            ftdi.write_data(bytes((Ftdi.WAIT_ON_LOW,)))
+        chunk = self._read_chunk(chunk_size)
+
+        # PyFtdi only retries a few empty USB reads before returning what it received so far, which happens
+        #   whenever SPI_BUSY stays high for longer. Keep collecting the rest of the chunk in that case
+        if len(chunk) < chunk_size:
+            chunk = bytearray(chunk)
+            while len(chunk) < chunk_size and not self._closing:
+                chunk += ftdi.read_data_bytes(chunk_size - len(chunk), HW_WAIT_READ_ATTEMPTS)
+        return chunk
+
+    def _prefetch_loop(self) -> None:
+        """
+        Body of the prefetch thread: reads frames into free buffers of the pool and queues them for
+        `__next__()`, until the reader is closed or reading fails. The reason it stopped is queued last.
+        """
+        stop_reason = StopIteration("SpiFtdiFrameReader was closed.")
+        try:
+            while not self._closing:
+                try:
+                    frame_data = self._free_frames.get(timeout=PREFETCH_POLL_TIMEOUT_S)
+                except queue.Empty:
+                    continue
+                # PyUSB releases the GIL while waiting for USB transfers, so the consumer can
+                #   process the previous frame meanwhile
+                self._read_frame(frame_data)
+                self._filled_frames.put(frame_data)
+        except Exception as e:
+            stop_reason = e if isinstance(e, StopIteration) else StopIteration(f"Error in prefetch thread: {e}")
+        finally:
+            self._filled_frames.put(stop_reason)
+
+    def _next_prefetched(self) -> memoryview:
+        """
+        Returns the oldest frame read by the prefetch thread and hands the oldest frame still
+        held by the consumer back to the thread.
+
+        Returns:
+            memoryview: The full frame data of length self.frame_length, valid until the call after the next one.
+
+        Raises:
+            StopIteration: If the prefetch thread stopped because of an error or because the reader was closed.
+        """
+        if len(self._held_frames) == NUM_HELD_FRAMES:
+            self._free_frames.put(self._held_frames.popleft())
+
+        item = self._filled_frames.get()
+        if isinstance(item, StopIteration):
+            # keep the reason queued, so every further call stops as well
+            self._filled_frames.put(item)
+            raise StopIteration(*item.args) from item
+
+        self._held_frames.append(item)
+        return item
 
     def close(self) -> None:
         """
         Gracefully terminates the FTDI controller and cleans up resources.
+        Stops the prefetch thread first, if prefetching is enabled.
         """
+        self._closing = True
+        if self._prefetch_thread is not None:
+            self._prefetch_thread.join(timeout=PREFETCH_JOIN_TIMEOUT_S)
+            self._prefetch_thread = None
         try:
             if self._spi:
                  self._spi.terminate()